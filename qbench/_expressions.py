@@ -1,11 +1,10 @@
 """Implementation of arithmetic expression parsing."""
 import ast
 import operator as op
-from functools import singledispatch
+from functools import lru_cache, singledispatch
+from math import pi
 from typing import Any, Callable, Dict
 
-import numpy as np
-
 operator_map: Dict[Any, Callable] = {
     ast.USub: op.neg,
     ast.Sub: op.sub,
@@ -15,12 +14,14 @@ operator_map: Dict[Any, Callable] = {
 }
 
 
+# The same few expressions (like "2 * pi") tend to appear over and over in descriptions
+@lru_cache(maxsize=128)
 def eval_expr(expr: str) -> float:
     """Evaluate given arithmetic expression.
 
     :param expr: arithmetic expression to parse. The expression can contain parentheses,
      numbers, binary operators - + * /, unary minus and an identifier "pi". The "pi"
-     identifier will resolve into numpy.py.
+     identifier will resolve into math.pi.
     :return: value of the evaluated expression.
     """
     return _eval_node(ast.parse(expr, mode="eval").body)
@@ -49,5 +50,5 @@ def _eval_unary_operator(node: ast.UnaryOp):
 @_eval_node.register
 def _eval_name(node: ast.Name):
     if node.id == "pi":
-        return np.pi
+        return pi
     raise ValueError(f"Unknown name: {node.id}")
@@ -68,7 +68,8 @@ def execute_in_batches(
      batch_circuits_with_keys_function, and each batch will be executed as a single job on
      the backend.
     :param show_progress: flag determining if a tqdm progress bar should be shown (True) or not
-     (False). Defaults to False.
+     (False). Defaults to False. Note that the progress bar is never shown if the output is not
+     attached to a terminal.
     :return: Iterable of namedtuples with fields `job` and `keys`. Each job runs circuits
      corresponding to keys in `keys`, and the order of circuits in the job corresponds to
      order of `keys`.
@@ -79,5 +80,5 @@ def execute_in_batches(
         for batch in batches
     )
     if show_progress:
-        result = tqdm(result, total=len(batches))
+        result = tqdm(result, total=len(batches), disable=None)
     return result
@@ -1,10 +1,21 @@
 import os
 import re
+from abc import abstractmethod
+from functools import lru_cache
 from importlib import import_module
 from typing import Any, Dict, List, Optional, Union
 
+import numpy as np
 from pydantic import BaseModel as PydanticBaseModel
-from pydantic import ConstrainedInt, Field, StrictStr, root_validator, validator
+from pydantic import (
+    ConstrainedInt,
+    Field,
+    PrivateAttr,
+    StrictStr,
+    root_validator,
+    validator,
+)
+from pydantic.errors import DictError, IntegerError, NumberNotGtError, StrRegexError
 from qiskit import IBMQ
 from qiskit.circuit import Parameter
 from qiskit.providers import BackendV1, BackendV2
@@ -36,6 +47,21 @@ class Qubit(ConstrainedInt):
 class TwoQubitBitstring(StrictStr):
     regex = re.compile("^[01]{2}$")
 
+    # Each key of every histogram is validated, and there are only four valid bitstrings.
+    # Hence, a membership test replaces all the string validators, and the regex is kept
+    # only for the sake of the schema.
+    _valid_values = frozenset({"00", "01", "10", "11"})
+
+    @classmethod
+    def __get_validators__(cls):
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value):
+        if value not in cls._valid_values:
+            raise StrRegexError(pattern=cls.regex.pattern)
+        return value
+
 
 class StrictPositiveInt(ConstrainedInt):
     strict = True
@@ -47,21 +73,26 @@ class AnglesRange(BaseModel):
     stop: float
     num_steps: StrictPositiveInt
 
-    validate_start = validator("start", allow_reuse=True, pre=True)(_parse_arithmetic_expression)
-    validate_stop = validator("stop", allow_reuse=True, pre=True)(_parse_arithmetic_expression)
+    validate_start_and_stop = validator("start", "stop", allow_reuse=True, pre=True)(
+        _parse_arithmetic_expression
+    )
 
-    @root_validator
-    def check_if_start_smaller_than_stop(cls, values):
-        if values.get("start") > values.get("stop"):
+    @root_validator(skip_on_failure=True)
+    def check_if_range_is_valid(cls, values):
+        start, stop = values["start"], values["stop"]
+        if start > stop:
             raise ValueError("Start cannot be smaller than stop.")
-        return values
-
-    @root_validator
-    def check_if_number_of_steps_is_one_when_start_equals_stop(cls, values):
-        if (values.get("start") == values.get("stop")) and values.get("num_steps") != 1:
+        if start == stop and values["num_steps"] != 1:
             raise ValueError("There can be only one step if start equals stop.")
         return values
 
+    @property
+    def angles(self) -> List[float]:
+        """All angles in this range, evenly spaced between start and stop (inclusive)."""
+        # Angles are converted to native floats, so that consumers iterating over them
+        # don't have to unbox numpy scalars.
+        return np.linspace(self.start, self.stop, self.num_steps).tolist()
+
 
 class QubitsPair(BaseModel):
     target: Qubit
@@ -74,15 +105,49 @@ class QubitsPair(BaseModel):
         return values
 
 
-SynchronousHistogram = Dict[TwoQubitBitstring, StrictPositiveInt]
-
-
+class SynchronousHistogram(Dict[TwoQubitBitstring, StrictPositiveInt]):
+    """Histogram of measurements, mapping two-qubit bitstrings to positive counts.
+
+    Results can comprise thousands of histograms, hence they are validated in a single pass
+    instead of validating each key and each count with a separate validator.
+    """
+
+    @classmethod
+    def __get_validators__(cls):
+        yield cls.validate
+
+    @classmethod
+    def __modify_schema__(cls, field_schema):
+        field_schema.update(
+            type="object",
+            patternProperties={
+                TwoQubitBitstring.regex.pattern: {"type": "integer", "exclusiveMinimum": 0}
+            },
+        )
+
+    @classmethod
+    def validate(cls, value):
+        if not isinstance(value, dict):
+            raise DictError()
+        for bitstring, count in value.items():
+            TwoQubitBitstring.validate(bitstring)
+            if not isinstance(count, int) or isinstance(count, bool):
+                raise IntegerError()
+            if count <= 0:
+                raise NumberNotGtError(limit_value=0)
+        return value
+
+
+# Descriptions are typically parsed and turned into backends multiple times with the same
+# paths, hence both checking and importing objects are cached.
+@lru_cache()
 def _import_object(object_spec):
     module_path, obj_name = object_spec.split(":")
     module = import_module(module_path)
     return getattr(module, obj_name)
 
 
+@lru_cache()
 def _check_is_correct_object_path(path):
     parts = path.split(":")
 
@@ -100,7 +165,32 @@ def _check_is_correct_object_path(path):
     return path
 
 
-class SimpleBackendDescription(BaseModel):
+class _CachingBackendDescription(BaseModel):
+    """Base class of backend descriptions which reuse backends they create.
+
+    Creating backend can be costly (e.g. it can require communicating with the provider), hence
+    the backend is created only once and reused in subsequent calls of `create_backend`, as long
+    as fields of the description stay the same. Subclasses implement `_create_backend`.
+    """
+
+    _backend: Any = PrivateAttr(default=None)
+    _backend_fields: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+
+    def create_backend(self):
+        # Private attributes are carried over by copy(update=...) and survive assignment to
+        # fields, hence we also check if the backend was created for the current fields.
+        fields = self.dict()
+        if self._backend is None or fields != self._backend_fields:
+            self._backend = self._create_backend()
+            self._backend_fields = fields
+        return self._backend
+
+    @abstractmethod
+    def _create_backend(self):
+        """Create new instance of the backend described by this object."""
+
+
+class SimpleBackendDescription(_CachingBackendDescription):
     provider: str
     name: str
     run_options: Dict[str, Any] = Field(default_factory=dict)
@@ -108,12 +198,12 @@ class SimpleBackendDescription(BaseModel):
 
     _verify_provider = validator("provider", allow_reuse=True)(_check_is_correct_object_path)
 
-    def create_backend(self):
+    def _create_backend(self):
         provider = _import_object(self.provider)()
         return provider.get_backend(self.name)
 
 
-class BackendFactoryDescription(BaseModel):
+class BackendFactoryDescription(_CachingBackendDescription):
     factory: str
     args: List[Any] = Field(default_factory=list)
     kwargs: Dict[str, Any] = Field(default_factory=dict)  # type: ignore
@@ -122,7 +212,7 @@ class BackendFactoryDescription(BaseModel):
 
     _verify_factory = validator("factory", allow_reuse=True)(_check_is_correct_object_path)
 
-    def create_backend(self):
+    def _create_backend(self):
         factory = _import_object(self.factory)
         return factory(*self.args, **self.kwargs)
 
@@ -137,27 +227,29 @@ class IBMQProviderDescription(BaseModel):
     project: Optional[str]
 
 
-class IBMQBackendDescription(BaseModel):
+class IBMQBackendDescription(_CachingBackendDescription):
     name: str
     asynchronous: bool = False
 
     provider: IBMQProviderDescription
 
-    def create_backend(self):
+    def _create_backend(self):
+        return self._get_provider().get_backend(self.name)
+
+    def _get_provider(self):
         if IBMQ.active_account():
-            provider = IBMQ.get_provider(
+            return IBMQ.get_provider(
                 hub=self.provider.hub,
                 group=self.provider.group,
                 project=self.provider.project,
             )
         else:
-            provider = IBMQ.enable_account(
+            return IBMQ.enable_account(
                 os.getenv("IBMQ_TOKEN"),
                 hub=self.provider.hub,
                 group=self.provider.group,
                 project=self.provider.project,
             )
-        return provider.get_backend(self.name)
 
 
 BackendDescription = Union[
@@ -5,7 +5,7 @@ to adapt them for command line usage.
 """
 from argparse import FileType, Namespace
 
-from yaml import safe_dump, safe_load
+from yaml import dump, load
 
 from ..common_models import BackendDescriptionRoot
 from ._models import (
@@ -20,33 +20,42 @@ from .experiment_runner import (
     tabulate_results,
 )
 
+try:
+    # Parser and emitter implemented in C (libyaml) are much faster for large results
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader  # type: ignore
+
 
 def _run_benchmark(args: Namespace) -> None:
     """Function executed when qbench disc-fourier benchmark is invoked."""
-    experiment = FourierExperimentSet(**safe_load(args.experiment_file))
-    backend_description = BackendDescriptionRoot(__root__=safe_load(args.backend_file)).__root__
+    experiment = FourierExperimentSet(**load(args.experiment_file, Loader=SafeLoader))
+    backend_description = BackendDescriptionRoot(
+        __root__=load(args.backend_file, Loader=SafeLoader)
+    ).__root__
 
     result = run_experiment(experiment, backend_description)
-    safe_dump(result.dict(), args.output, sort_keys=False, default_flow_style=None)
+    dump(result.dict(), args.output, Dumper=SafeDumper, sort_keys=False, default_flow_style=None)
 
 
 def _status(args: Namespace) -> None:
     """Function executed when qbench disc-fourier status is invoked."""
-    results = FourierDiscriminationAsyncResult(**safe_load(args.async_results))
+    results = FourierDiscriminationAsyncResult(**load(args.async_results, Loader=SafeLoader))
     counts = fetch_statuses(results)
     print(counts)
 
 
 def _resolve(args: Namespace) -> None:
     """Function executed when qbench disc-fourier resolve is invoked."""
-    results = FourierDiscriminationAsyncResult(**safe_load(args.async_results))
+    results = FourierDiscriminationAsyncResult(**load(args.async_results, Loader=SafeLoader))
     resolved = resolve_results(results)
-    safe_dump(resolved.dict(), args.output, sort_keys=False)
+    dump(resolved.dict(), args.output, Dumper=SafeDumper, sort_keys=False)
 
 
 def _tabulate(args: Namespace) -> None:
     """Function executed when qbench disc-fourier tabulate is invoked."""
-    results = FourierDiscriminationSyncResult(**safe_load(args.sync_results))
+    results = FourierDiscriminationSyncResult(**load(args.sync_results, Loader=SafeLoader))
     table = tabulate_results(results)
     table.to_csv(args.output, index=False)
 
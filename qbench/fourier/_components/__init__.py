@@ -1,4 +1,10 @@
-"""Module defining components used in Fourier discrimination experiment."""
+"""Module defining components used in Fourier discrimination experiment.
+
+Functions building components in gateset-specific submodules are cached, and hence calling
+them repeatedly with the same value of phi returns the same instruction. The returned
+instructions are shared and should not be modified in place.
+"""
+from functools import cached_property
 from typing import Optional, Union
 
 from qiskit.circuit import Instruction, Parameter
@@ -25,6 +31,10 @@ class FourierComponents:
         `IBMQ <https://quantum-computing.ibm.com/lab>`_ computers.
 
       If no gateset is provided, high-level gates will be used without restriction on basis gates.
+
+    .. note::
+       Components are constructed on first access and cached afterwards, hence accessing them
+       repeatedly (e.g. when assembling circuits for many pairs of qubits) is cheap.
     """
 
     def __init__(self, phi: Union[float, Parameter], gateset: Optional[str] = None):
@@ -32,7 +42,7 @@ class FourierComponents:
         self.phi = phi
         self._module = _GATESET_MAPPING[gateset]
 
-    @property
+    @cached_property
     def state_preparation(self) -> Instruction:
         """Instruction performing transformation $|00\\rangle$ -> Bell state
 
@@ -49,7 +59,7 @@ class FourierComponents:
         """
         return self._module.state_preparation()
 
-    @property
+    @cached_property
     def u_dag(self) -> Instruction:
         r"""Unitary $U^\dagger$ defining Fourier measurement.
 
@@ -71,7 +81,7 @@ class FourierComponents:
 
         return self._module.u_dag(self.phi)
 
-    @property
+    @cached_property
     def v0_dag(self) -> Instruction:
         """Instruction corresponding to the positive part of Holevo-Helstrom measurement.
 
@@ -86,7 +96,7 @@ class FourierComponents:
         """
         return self._module.v0_dag(self.phi)
 
-    @property
+    @cached_property
     def v1_dag(self) -> Instruction:
         """Instruction corresponding to the negative part of Holevo-Helstrom measurement.
 
@@ -100,7 +110,7 @@ class FourierComponents:
         """
         return self._module.v1_dag(self.phi)
 
-    @property
+    @cached_property
     def v0_v1_direct_sum_dag(self) -> Instruction:
         r"""Direct sum $V_0^\dagger\oplus V_1^\dagger$ of both parts of Holevo-Helstrom measurement.
 
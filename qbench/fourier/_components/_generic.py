@@ -5,12 +5,15 @@ Note that using components from this module on physical device typically require
 For detailed description of functions in this module refer to the documentation of
 FourierComponents class.
 """
-import numpy as np
+from functools import lru_cache
+from math import pi
+
 from qiskit.circuit import Instruction, QuantumCircuit
 
 from ...common_models import AnyParameter
 
 
+@lru_cache()
 def state_preparation() -> Instruction:
     circuit = QuantumCircuit(2, name="state-prep")
     circuit.h(0)
@@ -18,6 +21,7 @@ def state_preparation() -> Instruction:
     return circuit.to_instruction()
 
 
+@lru_cache()
 def u_dag(phi: AnyParameter) -> Instruction:
     circuit = QuantumCircuit(1, name="U-dag")
     circuit.h(0)
@@ -26,24 +30,27 @@ def u_dag(phi: AnyParameter) -> Instruction:
     return circuit.to_instruction()
 
 
+@lru_cache()
 def v0_dag(phi: AnyParameter) -> Instruction:
     circuit = QuantumCircuit(1, name="v0-dag")
-    circuit.rz(-np.pi / 2, 0)
-    circuit.ry(-(phi + np.pi) / 2, 0)
+    circuit.rz(-pi / 2, 0)
+    circuit.ry(-(phi + pi) / 2, 0)
     return circuit.to_instruction()
 
 
+@lru_cache()
 def v1_dag(phi: AnyParameter) -> Instruction:
     circuit = QuantumCircuit(1, name="v1-dag")
-    circuit.rz(-np.pi / 2, 0)
-    circuit.ry(-(phi + np.pi) / 2, 0)
-    circuit.rx(-np.pi, 0)
+    circuit.rz(-pi / 2, 0)
+    circuit.ry(-(phi + pi) / 2, 0)
+    circuit.rx(-pi, 0)
     return circuit.to_instruction()
 
 
+@lru_cache()
 def v0_v1_direct_sum(phi: AnyParameter) -> Instruction:
     circuit = QuantumCircuit(2, name="v0 ⊕ v1-dag")
-    circuit.p(np.pi, 0)
-    circuit.append(v0_dag(phi), [1])
+    circuit.p(pi, 0)
+    circuit.compose(v0_dag(phi).definition, [1], inplace=True)
     circuit.cnot(0, 1)
-    return circuit.decompose(["v0-dag"]).to_instruction()
+    return circuit.to_instruction()
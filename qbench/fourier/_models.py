@@ -1,3 +1,4 @@
+from itertools import product
 from typing import (
     Any,
     Iterable,
@@ -10,7 +11,6 @@ from typing import (
     TypeVar,
 )
 
-import numpy as np
 from pydantic import validator
 
 from ..common_models import (
@@ -34,16 +34,17 @@ class FourierExperimentSet(BaseModel):
 
     @validator("qubits")
     def check_if_all_pairs_of_qubits_are_different(cls, qubits):
-        list_of_qubits = [(qubits.target, qubits.ancilla) for qubits in qubits]
-        if len(set(list_of_qubits)) != len(list_of_qubits):
-            raise ValueError("All pairs of qubits should be distinct.")
+        seen = set()
+        for pair in qubits:
+            if (pair.target, pair.ancilla) in seen:
+                raise ValueError("All pairs of qubits should be distinct.")
+            seen.add((pair.target, pair.ancilla))
         return qubits
 
     def enumerate_experiment_labels(self) -> Iterable[Tuple[int, int, float]]:
         return (
             (pair.target, pair.ancilla, phi)
-            for pair in self.qubits
-            for phi in np.linspace(self.angles.start, self.angles.stop, self.angles.num_steps)
+            for pair, phi in product(self.qubits, self.angles.angles)
         )
 
 
@@ -52,10 +53,20 @@ class FourierDiscriminationMetadata(BaseModel):
     backend_description: BackendDescription
 
 
+class _ResultModel(BaseModel):
+    class Config:
+        # Results are never modified after they are created, so there is no need to copy them
+        # when they get nested in other models.
+        copy_on_model_validation = "none"
+        # Results are produced by qbench itself rather than written by users, so unknown
+        # fields are dropped instead of being collected and reported.
+        extra = "ignore"
+
+
 T = TypeVar("T", bound="QubitMitigationInfo")
 
 
-class QubitMitigationInfo(BaseModel):
+class QubitMitigationInfo(_ResultModel):
     prob_meas0_prep1: float
     prob_meas1_prep0: float
 
@@ -69,26 +80,26 @@ class QubitMitigationInfo(BaseModel):
         )
 
 
-class MitigationInfo(BaseModel):
+class MitigationInfo(_ResultModel):
     target: QubitMitigationInfo
     ancilla: QubitMitigationInfo
 
 
-class ResultForCircuit(BaseModel):
+class ResultForCircuit(_ResultModel):
     name: str
     histogram: SynchronousHistogram
     mitigation_info: Optional[MitigationInfo]
     mitigated_histogram: Optional[Any]
 
 
-class SingleResult(BaseModel):
+class SingleResult(_ResultModel):
     target: Qubit
     ancilla: Qubit
     phi: float
     results_per_circuit: List[ResultForCircuit]
 
 
-class BatchResult(BaseModel):
+class BatchResult(_ResultModel):
     job_id: str
     keys: Sequence[Tuple[int, int, str, float]]
 
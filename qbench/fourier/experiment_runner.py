@@ -1,7 +1,19 @@
 """Functions for running Fourier discrimination experiments and interacting with the results."""
 from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from logging import getLogger
-from typing import Dict, Iterable, List, Optional, Tuple, Union, cast
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 import numpy as np
 import pandas as pd
@@ -9,11 +21,18 @@ from mthree import M3Mitigation
 from qiskit import QiskitError, QuantumCircuit
 from qiskit.circuit import Parameter
 from qiskit.providers import JobV1
+from qiskit.result import Result
 from tqdm import tqdm
 
 from ..batching import BatchJob, execute_in_batches
-from ..common_models import Backend, BackendDescription
-from ..jobs import retrieve_jobs
+from ..common_models import (
+    Backend,
+    BackendDescription,
+    MeasurementsDict,
+    Qubit,
+    SynchronousHistogram,
+)
+from ..jobs import MAX_CONCURRENT_REQUESTS, retrieve_jobs
 from ..limits import get_limits
 from ..schemes.direct_sum import (
     assemble_direct_sum_circuits,
@@ -29,6 +48,7 @@ from ._models import (
     FourierDiscriminationAsyncResult,
     FourierDiscriminationSyncResult,
     FourierExperimentSet,
+    MitigationInfo,
     QubitMitigationInfo,
     ResultForCircuit,
     SingleResult,
@@ -36,6 +56,9 @@ from ._models import (
 
 logger = getLogger("qbench")
 
+# Maximum number of calibrated mitigators kept in memory
+MAX_CACHED_MITIGATORS = 256
+
 
 def _backend_name(backend) -> str:
     """Return backend name.
@@ -59,84 +82,213 @@ def _log_fourier_experiments(experiments: FourierExperimentSet) -> None:
     logger.info("Gateset: %s", experiments.gateset)
 
 
-def _matrix_from_mitigation_info(info: QubitMitigationInfo) -> np.ndarray:
-    """Construct Mthree-compatible matrix from mitigation info."""
+def _matrix_from_mitigation_info(info: Tuple[float, float]) -> np.ndarray:
+    """Construct Mthree-compatible matrix from pair (prob_meas0_prep1, prob_meas1_prep0)."""
+    prob_meas0_prep1, prob_meas1_prep0 = info
     return np.array(
         [
-            [1 - info.prob_meas1_prep0, info.prob_meas0_prep1],
-            [info.prob_meas1_prep0, 1 - info.prob_meas0_prep1],
+            [1 - prob_meas1_prep0, prob_meas0_prep1],
+            [prob_meas1_prep0, 1 - prob_meas0_prep1],
         ]
     )
 
 
+@lru_cache(maxsize=MAX_CACHED_MITIGATORS)
+def _get_mitigator(
+    backend: Backend,
+    target: int,
+    ancilla: int,
+    target_info: Tuple[float, float],
+    ancilla_info: Tuple[float, float],
+) -> M3Mitigation:
+    """Create Mthree mitigator calibrated for given pair of qubits.
+
+    Mitigators are cached, because all circuits run on the same pair of qubits in a single job
+    share the same calibration. The cache is keyed on the backend, the qubits and the values of
+    their readout errors, so changed calibration data yield a new mitigator. Cached mitigators
+    are kept for the lifetime of the process (up to MAX_CACHED_MITIGATORS of them), hence they
+    should never be recalibrated in place.
+
+    :param backend: backend used for executing job.
+    :param target: index of the target qubit.
+    :param ancilla: index of the ancilla qubit.
+    :param target_info: pair (prob_meas0_prep1, prob_meas1_prep0) for the target qubit.
+    :param ancilla_info: pair (prob_meas0_prep1, prob_meas1_prep0) for the ancilla qubit.
+    :return: mitigator calibrated using readout errors of target and ancilla.
+    """
+    mitigator = M3Mitigation(backend)
+
+    matrices: List[Optional[np.ndarray]] = [None] * backend.configuration().num_qubits
+    matrices[target] = _matrix_from_mitigation_info(target_info)
+    matrices[ancilla] = _matrix_from_mitigation_info(ancilla_info)
+
+    mitigator.cals_from_matrices(matrices)
+    return mitigator
+
+
 def _mitigate(
-    counts: Dict[str, int],
+    counts: Sequence[MeasurementsDict],
     target: int,
     ancilla: int,
     backend: Backend,
     mitigation_info: Dict[str, QubitMitigationInfo],
-) -> Dict[str, float]:
+) -> List[Dict[str, float]]:
     """Apply error mitigation to obtained counts.
 
-    :param counts: histogram of measured bitstrings.
+    :param counts: histograms of measured bitstrings, all obtained on the same pair of qubits.
     :param target: index of the target qubit.
     :param ancilla: index of the ancilla qubit.
     :param backend: backend used for executing job.
     :param mitigation_info: dictionary with keys 'ancilla' and 'target', mapping them to objects
      holding mitigation info (prob_meas1_prep0 and prob_meas0_prep1).
-    :return: dictionary with corrected quasi-distribution of bitstrings. Note that this contains
-     probabilities and not counts, but nevertheless can be used for computing probabilities.
+    :return: list of dictionaries with corrected quasi-distributions of bitstrings, one for
+     each histogram in counts. Note that they contain probabilities and not counts, but
+     nevertheless can be used for computing probabilities.
     """
-    mitigator = M3Mitigation(backend)
+    target_info, ancilla_info = mitigation_info["target"], mitigation_info["ancilla"]
+    mitigator = _get_mitigator(
+        backend,
+        target,
+        ancilla,
+        (target_info.prob_meas0_prep1, target_info.prob_meas1_prep0),
+        (ancilla_info.prob_meas0_prep1, ancilla_info.prob_meas1_prep0),
+    )
+    # Passing all histograms at once makes Mthree correct them in a single call
+    results = mitigator.apply_correction(list(counts), [target, ancilla])
+    # Wrap value in native floats, otherwise we get serialization problems
+    return [dict(zip(result.keys(), map(float, result.values()))) for result in results]
 
-    matrices: List[Optional[np.ndarray]] = [None for _ in range(backend.configuration().num_qubits)]
-    matrices[target] = _matrix_from_mitigation_info(mitigation_info["target"])
-    matrices[ancilla] = _matrix_from_mitigation_info(mitigation_info["ancilla"])
 
-    mitigator.cals_from_matrices(matrices)
-    result = mitigator.apply_correction(counts, [target, ancilla])
-    # Wrap value in native floats, otherwise we get serialization problems
-    return {key: float(value) for key, value in result.items()}
+MitigationInfoDict = Dict[int, QubitMitigationInfo]
 
 
-def _extract_result_from_job(
-    job: JobV1, target: int, ancilla: int, i: int, name: str
-) -> Optional[ResultForCircuit]:
-    """Extract meaningful information from job and wrap them in serializable object.
+def _fetch_job_result(job: JobV1) -> Optional[Result]:
+    """Fetch result of given job, or return None if the job was not successful."""
+    try:
+        return job.result()
+    except QiskitError:
+        return None
 
-    .. note::
-       Single job can comprise running multiple circuits (experiments in Qiskit terminology)
-       and hence we need parameter i to identify which one we are processing right now.
 
-    :param job: Qiskit job used for computing results.
-    :param target: index of the target qubit.
-    :param ancilla: index of the ancilla qubit.
-    :param i: index of the experiment in job.
-    :param name: name of the circuit to be used in the resulting object.
-    :return: object containing results or None if the provided job was not successful.
+def _get_counts(job_result: Result, num_circuits: int) -> List[Optional[MeasurementsDict]]:
+    """Get histograms of all circuits run in a job.
+
+    :param job_result: result of the job, as obtained by `_fetch_job_result`.
+    :param num_circuits: number of circuits run in the job.
+    :return: list of histograms, with None in place of each circuit whose histogram
+     could not be obtained.
     """
     try:
-        result = {"name": name, "histogram": job.result().get_counts()[i]}
+        counts = job_result.get_counts()
     except QiskitError:
-        return None
+        # Some of the circuits have no results, so we need to look at each one separately
+        return [_get_single_counts(job_result, i) for i in range(num_circuits)]
+    # Qiskit returns a bare histogram instead of a list if the job comprised only one circuit
+    return [counts] if isinstance(counts, dict) else counts
+
+
+def _get_single_counts(job_result: Result, i: int) -> Optional[MeasurementsDict]:
+    """Get histogram of i-th circuit run in a job, or None if it is unavailable."""
     try:
-        # We ignore some typing errors, since we are essentially accessing attributes that might
-        # not exist according to their base classes.
-        props = job.properties()  # type: ignore
-        result["mitigation_info"] = {
-            "target": QubitMitigationInfo.from_job_properties(props, target),
-            "ancilla": QubitMitigationInfo.from_job_properties(props, ancilla),
-        }
-        result["mitigated_histogram"] = _mitigate(
-            result["histogram"],
+        return job_result.get_counts(i)
+    except QiskitError:
+        return None
+
+
+def _fetch_mitigation_info(job: JobV1, qubits: Iterable[int]) -> Optional[MitigationInfoDict]:
+    """Fetch mitigation info for given qubits from properties of the job.
+
+    :param job: Qiskit job used for computing results.
+    :param qubits: indices of qubits for which mitigation info should be fetched.
+    :return: dictionary mapping qubit indices to their mitigation info, or None if
+     the job does not provide mitigation info.
+    """
+    # We ignore some typing errors, since we are essentially accessing attributes that might
+    # not exist according to their base classes.
+    props = job.properties() if hasattr(job, "properties") else None  # type: ignore
+    if props is None:
+        return None
+    return {qubit: QubitMitigationInfo.from_job_properties(props, qubit) for qubit in qubits}
+
+
+def _fetch_job_status(job: JobV1) -> str:
+    """Fetch name of the status of given job."""
+    return job.status().name
+
+
+def _mitigate_batch(
+    batch: BatchJob,
+    counts: Sequence[Optional[MeasurementsDict]],
+    mitigation_info: Optional[MitigationInfoDict],
+) -> List[Optional[Dict[str, float]]]:
+    """Apply error mitigation to histograms of all circuits run in a job.
+
+    Histograms of circuits run on the same pair of qubits share the calibration, and hence
+    they are corrected together.
+
+    :param batch: batch whose job was used for computing the histograms.
+    :param counts: histograms of circuits in the batch, as obtained by `_get_counts`.
+    :param mitigation_info: mitigation info of qubits used in the job, as obtained by
+     `_fetch_mitigation_info`.
+    :return: list of mitigated histograms, with None in place of each circuit whose histogram
+     is unavailable. If mitigation info is None, the list contains only Nones.
+    """
+    mitigated: List[Optional[Dict[str, float]]] = [None] * len(counts)
+    if mitigation_info is None:
+        return mitigated
+
+    indices_by_pair: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+    for i, (target, ancilla, *_) in enumerate(batch.keys):
+        if counts[i] is not None:
+            indices_by_pair[target, ancilla].append(i)
+
+    for (target, ancilla), indices in indices_by_pair.items():
+        qubits_info = {"target": mitigation_info[target], "ancilla": mitigation_info[ancilla]}
+        histograms = _mitigate(
+            [cast(MeasurementsDict, counts[i]) for i in indices],
             target,
             ancilla,
-            job.backend(),  # type: ignore
-            result["mitigation_info"],
+            batch.job.backend(),  # type: ignore
+            qubits_info,
         )
-    except AttributeError:
-        pass
-    return ResultForCircuit.parse_obj(result)
+        for i, histogram in zip(indices, histograms):
+            mitigated[i] = histogram
+    return mitigated
+
+
+def _extract_result_from_job(
+    counts: MeasurementsDict,
+    mitigated_counts: Optional[Dict[str, float]],
+    mitigation_info: Optional[MitigationInfoDict],
+    target: int,
+    ancilla: int,
+    name: str,
+) -> ResultForCircuit:
+    """Extract meaningful information from job and wrap them in serializable object.
+
+    :param counts: histogram of the processed circuit.
+    :param mitigated_counts: mitigated histogram of the processed circuit, as obtained by
+     `_mitigate_batch`.
+    :param mitigation_info: mitigation info of qubits used in the job, as obtained by
+     `_fetch_mitigation_info`.
+    :param target: index of the target qubit.
+    :param ancilla: index of the ancilla qubit.
+    :param name: name of the circuit to be used in the resulting object.
+    :return: object containing results.
+    """
+    # All the data below come either from Qiskit or from already validated objects, hence
+    # we construct models directly and skip the costly validation.
+    histogram = cast(SynchronousHistogram, counts)
+    if mitigation_info is None:
+        return ResultForCircuit.construct(name=name, histogram=histogram)
+    return ResultForCircuit.construct(
+        name=name,
+        histogram=histogram,
+        mitigation_info=MitigationInfo.construct(
+            target=mitigation_info[target], ancilla=mitigation_info[ancilla]
+        ),
+        mitigated_histogram=mitigated_counts,
+    )
 
 
 CircuitKey = Tuple[int, int, str, float]
@@ -172,62 +324,114 @@ def _collect_circuits_and_keys(
     )
 
     logger.info("Assembling experiments...")
-    circuit_key_pairs = [
-        (
-            circuit.bind_parameters({components.phi: phi}),
-            (target, ancilla, circuit_name, float(phi)),
-        )
-        for (target, ancilla, phi) in tqdm(list(experiments.enumerate_experiment_labels()))
-        for circuit_name, circuit in _asemble(target, ancilla).items()
-    ]
+    # Structure of circuits depends only on the pair of qubits, and not on the value of phi.
+    # Hence, we assemble them once for each pair, and then only bind values of phi.
+    templates = {
+        (pair.target, pair.ancilla): _asemble(pair.target, pair.ancilla)
+        for pair in experiments.qubits
+    }
+    circuits: List[QuantumCircuit] = []
+    keys: List[CircuitKey] = []
+    labels = experiments.enumerate_experiment_labels()
+    total = len(experiments.qubits) * experiments.angles.num_steps
+    for target, ancilla, phi in tqdm(labels, total=total, disable=None):
+        for circuit_name, circuit in templates[target, ancilla].items():
+            circuits.append(circuit.assign_parameters({components.phi: phi}))
+            keys.append((target, ancilla, circuit_name, phi))
 
-    circuits, keys = zip(*circuit_key_pairs)
-    return circuits, keys
+    return tuple(circuits), tuple(keys)
 
 
-def _iter_batches(batches: Iterable[BatchJob]) -> Iterable[Tuple[int, CircuitKey, JobV1]]:
-    """Iterate batches in a flat manner.
+def _fetch_job_data(batch: BatchJob) -> Tuple[Optional[Result], Optional[MitigationInfoDict]]:
+    """Fetch result of the job from given batch, together with mitigation info of its qubits.
 
-    The returned iterable yields triples of the form (i, key, job) where:
-    - key is the key in one one of the batches
-    - i is its index in the corresponding batch
-    - job is a job comprising this batch
+    The result is None if the job was not successful, in which case mitigation info is not
+    fetched at all.
     """
-    return (
-        (i, key, batch.job)
-        for batch in tqdm(batches, desc="Batch")
-        for i, key in enumerate(tqdm(batch.keys, desc="Circuit", leave=False))
-    )
-
+    job_result = _fetch_job_result(batch.job)
+    if job_result is None:
+        return None, None
+    qubits = {qubit for target, ancilla, *_ in batch.keys for qubit in (target, ancilla)}
+    return job_result, _fetch_mitigation_info(batch.job, qubits)
 
-def _resolve_batches(batches: Iterable[BatchJob]) -> List[SingleResult]:
-    """Resolve all results from batch of jobs and wrap them in a serializable object.
 
-    The number of returned objects can be less than what can be deduced from batches size iff
-    some jobs have failed.
+def _fetch_jobs_data(
+    batches: Sequence[BatchJob],
+) -> List[Tuple[Optional[Result], Optional[MitigationInfoDict]]]:
+    """Fetch results and mitigation info of jobs from all batches.
 
-    :param batches: batches to be processed.
-    :return: dictionary mapping triples (target, ancilla, phi) to a list of results for each
-     circuit with that parameters.
+    Data are downloaded concurrently, so that waiting for one job does not block
+    fetching data of the others. The progress bar advances whenever data of some job
+    arrive, and the returned list follows the order of batches.
+    """
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        futures = {executor.submit(_fetch_job_data, batch): i for i, batch in enumerate(batches)}
+        jobs_data = {}
+        for future in tqdm(as_completed(futures), total=len(batches), desc="Batch", disable=None):
+            jobs_data[futures[future]] = future.result()
+    return [jobs_data[i] for i in range(len(batches))]
+
+
+def _iter_results(
+    batches: Sequence[BatchJob],
+    jobs_data: Sequence[Tuple[Optional[Result], Optional[MitigationInfoDict]]],
+) -> Iterable[Tuple[Tuple[int, int, float], ResultForCircuit]]:
+    """Iterate results of all successfully executed circuits from given batches.
+
+    The returned iterable yields pairs ((target, ancilla, phi), result), in the same order
+    in which keys appear in the batches.
     """
-    resolved = defaultdict(list)
-
     num_failed = 0
-    for i, (target, ancilla, name, phi), job in _iter_batches(batches):
-        result = _extract_result_from_job(job, target, ancilla, i, name)
-        if result is None:
-            num_failed += 1
-        else:
-            resolved[target, ancilla, phi].append(result)
+    for batch, (job_result, mitigation_info) in zip(batches, jobs_data):
+        if job_result is None:
+            num_failed += len(batch.keys)
+            continue
+        # Histograms are shared by all circuits in the job, hence we obtain them only once
+        # per batch.
+        counts = _get_counts(job_result, len(batch.keys))
+        mitigated_counts = _mitigate_batch(batch, counts, mitigation_info)
+        for i, (target, ancilla, name, phi) in enumerate(batch.keys):
+            # Single job can comprise running multiple circuits (experiments in Qiskit
+            # terminology), and i identifies which one we are processing right now.
+            histogram = counts[i]
+            if histogram is None:
+                num_failed += 1
+                continue
+            yield (target, ancilla, phi), _extract_result_from_job(
+                histogram, mitigated_counts[i], mitigation_info, target, ancilla, name
+            )
 
     if num_failed:
         logger.warning(
             "Some jobs have failed. Examine the output file to determine which data are missing."
         )
 
+
+def _resolve_batches(batches: Sequence[BatchJob]) -> List[SingleResult]:
+    """Resolve all results from batch of jobs and wrap them in a serializable object.
+
+    The number of returned objects can be less than what can be deduced from batches size iff
+    some jobs have failed.
+
+    :param batches: batches to be processed.
+    :return: list of objects containing results for each circuit with given triple
+     (target, ancilla, phi).
+    """
+    jobs_data = _fetch_jobs_data(batches)
+
+    # Circuits with the same (target, ancilla, phi) triple are not guaranteed to occupy
+    # consecutive positions in the batches (e.g. batches of asynchronous jobs can come in any
+    # order), hence results are accumulated in a dictionary.
+    resolved: Dict[Tuple[int, int, float], List[ResultForCircuit]] = defaultdict(list)
+    for label, result in _iter_results(batches, jobs_data):
+        resolved[label].append(result)
+
     return [
-        SingleResult.parse_obj(
-            {"target": target, "ancilla": ancilla, "phi": phi, "results_per_circuit": results}
+        SingleResult.construct(
+            target=cast(Qubit, target),
+            ancilla=cast(Qubit, ancilla),
+            phi=phi,
+            results_per_circuit=results,
         )
         for (target, ancilla, phi), results in resolved.items()
     ]
@@ -256,13 +460,17 @@ def run_experiment(
     circuits, keys = _collect_circuits_and_keys(experiments, components)
 
     logger.info("Submitting jobs...")
-    batches = execute_in_batches(
-        backend,
-        circuits,
-        keys,
-        experiments.num_shots,
-        get_limits(backend).max_circuits,
-        show_progress=True,
+    # All jobs are submitted before waiting for any of them to complete, so that
+    # the backend can process them while we are waiting for the results.
+    batches = list(
+        execute_in_batches(
+            backend,
+            circuits,
+            keys,
+            experiments.num_shots,
+            get_limits(backend).max_circuits,
+            show_progress=True,
+        )
     )
 
     metadata = {
@@ -307,7 +515,10 @@ def fetch_statuses(async_results: FourierDiscriminationAsyncResult) -> Dict[str,
     jobs = retrieve_jobs(backend, job_ids)
     logger.info("Done")
 
-    return dict(Counter(job.status().name for job in jobs))
+    logger.info("Fetching statuses of jobs...")
+    # Each status query is a separate request to the backend, so we issue them concurrently.
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        return dict(Counter(executor.map(_fetch_job_status, jobs)))
 
 
 def resolve_results(
@@ -343,45 +554,46 @@ def resolve_results(
     return result
 
 
-def tabulate_results(sync_results: FourierDiscriminationSyncResult) -> pd.DataFrame:
-    compute_probabilities = (
-        compute_probabilities_from_postselection_measurements
-        if sync_results.metadata.experiments.method.lower() == "postselection"
-        else compute_probabilities_from_direct_sum_measurements
-    )
+def _histograms_by_circuit(entry: SingleResult, field: str) -> Dict[str, MeasurementsDict]:
+    """Collect given histograms of circuits in entry as kwargs of compute_probabilities."""
+    return {f"{info.name}_counts": getattr(info, field) for info in entry.results_per_circuit}
+
+
+def _has_mitigated_histograms(entry: SingleResult) -> bool:
+    """Check if all circuits in entry have mitigated histograms."""
+    return all(info.mitigated_histogram is not None for info in entry.results_per_circuit)
 
-    def _make_row(entry):
-        data = [
-            entry.target,
-            entry.ancilla,
-            entry.phi,
-            compute_probabilities(
-                **{f"{info.name}_counts": info.histogram for info in entry.results_per_circuit}
-            ),
-        ]
-        try:
-            data.append(
-                compute_probabilities(
-                    **{
-                        f"{info.name}_counts": info.mitigated_histogram
-                        for info in entry.results_per_circuit
-                    }
-                ),
-            )
-        except AttributeError:
-            pass  # totally acceptable, not all results have mitigation info
-        return data
+
+def tabulate_results(sync_results: FourierDiscriminationSyncResult) -> pd.DataFrame:
+    compute_probabilities: Callable[..., float]
+    if sync_results.metadata.experiments.method.lower() == "postselection":
+        compute_probabilities = compute_probabilities_from_postselection_measurements
+    else:
+        compute_probabilities = compute_probabilities_from_direct_sum_measurements
 
     logger.info("Tabulating results...")
-    rows = [_make_row(entry) for entry in tqdm(sync_results.data)]
+    data = sync_results.data
+    columns = {
+        "target": [entry.target for entry in data],
+        "ancilla": [entry.ancilla for entry in data],
+        "phi": [entry.phi for entry in data],
+        "disc_prob": [
+            compute_probabilities(**_histograms_by_circuit(entry, "histogram"))
+            for entry in tqdm(data, disable=None)
+        ],
+    }
 
-    # We assume that either all circuits have mitigation info, or none of them has
-    columns = (
-        ["target", "ancilla", "phi", "disc_prob"]
-        if len(rows[0]) == 4
-        else ["target", "ancilla", "phi", "disc_prob", "mit_disc_prob"]
-    )
+    # Not all backends provide mitigation info, which is totally acceptable. If only some
+    # of the results have mitigated histograms, the remaining rows get NaN instead.
+    has_mitigated_histograms = [_has_mitigated_histograms(entry) for entry in data]
+    if any(has_mitigated_histograms):
+        columns["mit_disc_prob"] = [
+            compute_probabilities(**_histograms_by_circuit(entry, "mitigated_histogram"))
+            if has_mitigated
+            else np.nan
+            for entry, has_mitigated in zip(data, has_mitigated_histograms)
+        ]
 
-    result = pd.DataFrame(data=rows, columns=columns)
+    result = pd.DataFrame(columns)
     logger.info("Done")
     return result
@@ -1,5 +1,6 @@
 """Testing utilities related qbench.fourier packager."""
-from typing import Sequence, Tuple
+from collections import Counter, defaultdict
+from typing import Dict, List, Sequence, Tuple
 
 import pandas as pd
 
@@ -8,6 +9,13 @@ from ._models import FourierDiscriminationSyncResult, FourierExperimentSet
 LabelSequence = Sequence[Tuple[int, int, float]]
 
 
+def _phis_by_qubit_pair(labels: LabelSequence) -> Dict[Tuple[int, int], List[float]]:
+    phis: Dict[Tuple[int, int], List[float]] = defaultdict(list)
+    for target, ancilla, phi in labels:
+        phis[target, ancilla].append(phi)
+    return phis
+
+
 def _experiment_labels_equal(actual: LabelSequence, expected: LabelSequence) -> bool:
     """Assert two sequences of experiment labels are equal.
 
@@ -17,9 +25,13 @@ def _experiment_labels_equal(actual: LabelSequence, expected: LabelSequence) ->
     The exact equality of angles cannot be expected because of the serialization of floating
     point numbers.
     """
-    return len(actual) == len(expected) and all(
-        label1[0:2] == label2[0:2] and abs(label1[2] - label2[2]) < 1e-7
-        for label1, label2 in zip(sorted(actual), sorted(expected))
+    if Counter(label[0:2] for label in actual) != Counter(label[0:2] for label in expected):
+        return False
+    actual_phis, expected_phis = _phis_by_qubit_pair(actual), _phis_by_qubit_pair(expected)
+    return all(
+        abs(phi1 - phi2) < 1e-7
+        for pair, phis in expected_phis.items()
+        for phi1, phi2 in zip(sorted(actual_phis[pair]), sorted(phis))
     )
 
 
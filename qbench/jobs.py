@@ -1,10 +1,19 @@
 """Implementation of utilities for interacting with jobs."""
+from concurrent.futures import ThreadPoolExecutor
 from functools import singledispatch
+from itertools import islice
 from typing import Sequence
 
 from qiskit.providers import JobV1
+from qiskit.providers.ibmq import IBMQBackend
+from qiskit.providers.ibmq.job import IBMQJob
 
-# from qiskit.providers.ibmq import IBMQBackend, IBMQJob
+# Maximum number of job ids queried in a single request to IBMQ
+IBMQ_JOBS_PER_REQUEST = 200
+
+# Maximum number of concurrent requests made to a backend when retrieving jobs, or querying
+# them for their results or statuses
+MAX_CONCURRENT_REQUESTS = 16
 
 
 @singledispatch
@@ -13,12 +22,26 @@ def retrieve_jobs(backend, job_ids: Sequence[str]) -> Sequence[JobV1]:
 
     :param backend: backend which was used to run the jobs.
     :param job_ids: identifiers of jobs to obtain.
-    :return: sequence of jobs. Note that it is not guaranteed that the order of this sequence
-     will match order of ids in job_ids parameter.
+    :return: sequence of jobs, ordered in the same way as ids in job_ids parameter.
     """
-    return [backend.retrieve_job(job_id) for job_id in job_ids]
+    # Each job is retrieved in a separate request, hence we issue them concurrently.
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        return list(executor.map(backend.retrieve_job, job_ids))
 
 
-# @retrieve_jobs.register
-# def _retrieve_jobs_from_ibmq(backend: IBMQBackend, job_ids: Sequence[str]) -> Sequence[IBMQJob]:
-#     return backend.jobs(db_filter={"id": {"inq": job_ids}}, limit=len(job_ids))
+@retrieve_jobs.register
+def _retrieve_jobs_from_ibmq(backend: IBMQBackend, job_ids: Sequence[str]) -> Sequence[IBMQJob]:
+    # Querying for all the jobs at once avoids one round-trip to IBMQ per job. The ids are
+    # split into chunks, since a single query can only return a limited number of jobs.
+    ids_it = iter(job_ids)
+    jobs = []
+    while chunk := list(islice(ids_it, IBMQ_JOBS_PER_REQUEST)):
+        jobs.extend(backend.jobs(db_filter={"id": {"inq": chunk}}, limit=len(chunk)))
+    # IBMQ returns jobs in arbitrary order, so we restore the order of requested ids. Jobs
+    # not returned by the query are retrieved one by one, which raises an error naming the
+    # job if it indeed cannot be found.
+    jobs_by_id = {job.job_id(): job for job in jobs}
+    return [
+        jobs_by_id[job_id] if job_id in jobs_by_id else backend.retrieve_job(job_id)
+        for job_id in job_ids
+    ]
@@ -1,8 +1,12 @@
 """Module containing utilities, maybe combinatorial ones."""
-from typing import Dict
+from typing import Dict, Optional
 
 from qiskit import QuantumCircuit, transpile
 
+from ..batching import execute_in_batches
+from ..common_models import Backend, MeasurementsDict
+from ..limits import get_limits
+
 
 def remap_qubits(circuit: QuantumCircuit, virtual_to_physical: Dict[int, int]) -> QuantumCircuit:
     """Transpile a circuit by assigning virtual qubits to physical ones.
@@ -19,3 +23,51 @@ def remap_qubits(circuit: QuantumCircuit, virtual_to_physical: Dict[int, int]) -
         optimization_level=0,
         initial_layout={qreg[key]: value for key, value in virtual_to_physical.items()},
     )
+
+
+def marginal_count(counts: MeasurementsDict, bit: int, outcome: str) -> int:
+    """Count measurements in which given bit had given outcome.
+
+    This is equivalent to `marginal_counts(counts, [bit]).get(outcome, 0)`, but avoids
+    constructing the whole marginal distribution.
+
+    :param counts: histogram of measured bitstrings.
+    :param bit: index of the bit, counting from the right as in Qiskit's bitstrings.
+    :param outcome: measured value of the bit, either "0" or "1".
+    :return: total count of bitstrings with given outcome on given bit.
+    """
+    return sum(count for bitstring, count in counts.items() if bitstring[-1 - bit] == outcome)
+
+
+def _max_circuits(backend: Backend) -> Optional[int]:
+    """Return maximum number of circuits in a single job, or None if it is unknown."""
+    try:
+        return get_limits(backend).max_circuits
+    except NotImplementedError:
+        return None
+
+
+def run_circuits(
+    backend: Backend, circuits: Dict[str, QuantumCircuit], shots: int
+) -> Dict[str, MeasurementsDict]:
+    """Run circuits on a backend and obtain their histograms.
+
+    The circuits are run in as few jobs as limits of the backend permit, and all the jobs are
+    submitted before waiting for any of them to complete. If limits of the backend are not
+    known, all the circuits are run in a single job.
+
+    :param backend: backend to use for sampling.
+    :param circuits: mapping of the form key -> circuit.
+    :param shots: number of shots for each circuit.
+    :return: mapping of the form key -> histogram of measurements of corresponding circuit.
+    """
+    batches = list(
+        execute_in_batches(
+            backend, list(circuits.values()), list(circuits), shots, _max_circuits(backend)
+        )
+    )
+    counts: Dict[str, MeasurementsDict] = {}
+    for batch in batches:
+        result = batch.job.result()
+        counts.update((key, result.get_counts(i)) for i, key in enumerate(batch.keys))
+    return counts
@@ -4,10 +4,9 @@ from typing import Dict, Union
 from qiskit import QuantumCircuit
 from qiskit.circuit import Instruction
 from qiskit.providers import BackendV1, BackendV2
-from qiskit.result import marginal_counts
 
 from ..common_models import MeasurementsDict
-from ._utils import remap_qubits
+from ._utils import marginal_count, remap_qubits, run_circuits
 
 
 def assemble_direct_sum_circuits(
@@ -58,9 +57,9 @@ def compute_probabilities_from_direct_sum_measurements(
     :return: probability of distinguishing between u and identity measurements.
     """
     num_shots_per_measurement = sum(id_counts.values())
-    return (
-        marginal_counts(id_counts, [1]).get("1", 0) + marginal_counts(u_counts, [1]).get("0", 0)
-    ) / (2 * num_shots_per_measurement)
+    return (marginal_count(id_counts, 1, "1") + marginal_count(u_counts, 1, "0")) / (
+        2 * num_shots_per_measurement
+    )
 
 
 def benchmark_using_direct_sum(
@@ -110,7 +109,6 @@ def benchmark_using_direct_sum(
         ancilla=ancilla,
     )
 
-    id_counts = backend.run(circuits["id"], shots=num_shots_per_measurement).result().get_counts()
-    u_counts = backend.run(circuits["u"], shots=num_shots_per_measurement).result().get_counts()
+    counts = run_circuits(backend, circuits, num_shots_per_measurement)
 
-    return compute_probabilities_from_direct_sum_measurements(id_counts, u_counts)
+    return compute_probabilities_from_direct_sum_measurements(counts["id"], counts["u"])
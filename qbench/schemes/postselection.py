@@ -4,10 +4,9 @@ from typing import Dict, Union
 from qiskit import QuantumCircuit
 from qiskit.circuit import Instruction
 from qiskit.providers import BackendV1, BackendV2
-from qiskit.result import marginal_counts
 
 from ..common_models import MeasurementsDict
-from ._utils import remap_qubits
+from ._utils import marginal_count, remap_qubits, run_circuits
 
 
 def _construct_identity_circuit(
@@ -85,10 +84,10 @@ def compute_probabilities_from_postselection_measurements(
     :return: probability of distinguishing between u and identity measurements.
     """
     return (
-        u_v0_counts.get("00", 0) / marginal_counts(u_v0_counts, [0]).get("0", 0)
-        + u_v1_counts.get("01", 0) / marginal_counts(u_v1_counts, [0]).get("1", 0)
-        + id_v0_counts.get("10", 0) / marginal_counts(id_v0_counts, [0]).get("0", 0)
-        + id_v1_counts.get("11", 0) / marginal_counts(id_v1_counts, [0]).get("1", 0)
+        u_v0_counts.get("00", 0) / marginal_count(u_v0_counts, 0, "0")
+        + u_v1_counts.get("01", 0) / marginal_count(u_v1_counts, 0, "1")
+        + id_v0_counts.get("10", 0) / marginal_count(id_v0_counts, 0, "0")
+        + id_v1_counts.get("11", 0) / marginal_count(id_v1_counts, 0, "1")
     ) / 4
 
 
@@ -141,10 +140,7 @@ def benchmark_using_postselection(
         ancilla=ancilla,
     )
 
-    counts = {
-        key: backend.run(circuit, shots=num_shots_per_measurement).result().get_counts()
-        for key, circuit in circuits.items()
-    }
+    counts = run_circuits(backend, circuits, num_shots_per_measurement)
 
     return compute_probabilities_from_postselection_measurements(
         counts["id_v0"], counts["id_v1"], counts["u_v0"], counts["u_v1"]
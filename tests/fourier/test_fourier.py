@@ -116,6 +116,25 @@ class TestFourierCircuits:
         _assert_are_equivalent(v0_v1_direct_sum, expected)
 
 
+@pytest.mark.parametrize("gateset", [None, "lucy", "rigetti", "ibmq"])
+class TestFourierComponentsCaching:
+    def test_components_for_the_same_phi_share_instructions(self, gateset):
+        components = FourierComponents(phi=np.pi / 3, gateset=gateset)
+        other_components = FourierComponents(phi=np.pi / 3, gateset=gateset)
+
+        assert components.state_preparation is other_components.state_preparation
+        assert components.u_dag is other_components.u_dag
+        assert components.v0_dag is other_components.v0_dag
+        assert components.v1_dag is other_components.v1_dag
+        assert components.v0_v1_direct_sum_dag is other_components.v0_v1_direct_sum_dag
+
+    def test_components_for_different_phis_do_not_share_instructions(self, gateset):
+        components = FourierComponents(phi=np.pi / 3, gateset=gateset)
+        other_components = FourierComponents(phi=np.pi / 4, gateset=gateset)
+
+        assert components.v0_dag is not other_components.v0_dag
+
+
 def test_computed_exact_probabilities_are_feasible():
     phis = np.linspace(0, 2 * np.pi, 10000)
 
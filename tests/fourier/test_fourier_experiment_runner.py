@@ -1,8 +1,15 @@
+import logging
+
 import pytest
+from qiskit.result import Result
 
 from qbench.common_models import SimpleBackendDescription
 from qbench.fourier import FourierExperimentSet
+from qbench.fourier._models import QubitMitigationInfo
 from qbench.fourier.experiment_runner import (
+    _get_counts,
+    _get_mitigator,
+    _mitigate,
     fetch_statuses,
     resolve_results,
     run_experiment,
@@ -12,6 +19,7 @@ from qbench.fourier.testing import (
     assert_sync_results_contain_data_for_all_experiments,
     assert_tabulated_results_contain_data_for_all_experiments,
 )
+from qbench.testing import MockProvider, MockSimulator
 
 
 @pytest.fixture
@@ -28,6 +36,15 @@ def sync_backend_description():
     )
 
 
+@pytest.fixture
+def failing_backend_description():
+    # Failing mock backend fails its second and third job, and it counts jobs across tests
+    MockProvider().reset_caches()
+    return SimpleBackendDescription(
+        provider="qbench.testing:MockProvider", name="failing-mock-backend", asynchronous=False
+    )
+
+
 @pytest.fixture
 def backend_with_mitigation_info_description():
     return SimpleBackendDescription(
@@ -61,6 +78,53 @@ class TestSynchronousExecutionOfExperiments:
         results = run_experiment(experiments, sync_backend_description)
         assert_sync_results_contain_data_for_all_experiments(experiments, results)
 
+    def test_results_of_successful_jobs_are_resolved_even_if_some_jobs_failed(
+        self, experiments, failing_backend_description, caplog
+    ):
+        with caplog.at_level(logging.WARNING):
+            results = run_experiment(experiments, failing_backend_description)
+
+        num_circuits = sum(len(entry.results_per_circuit) for entry in results.data)
+        num_circuits_per_label = 2 if experiments.method == "direct_sum" else 4
+        # There are 9 triples (target, ancilla, phi), and each of the two failed jobs
+        # comprised two circuits.
+        assert num_circuits == 9 * num_circuits_per_label - 4
+        assert "Some jobs have failed." in caplog.text
+
+
+def _experiment_result(counts):
+    return {
+        "shots": 10,
+        "success": counts is not None,
+        "status": "DONE" if counts is not None else "ERROR",
+        "data": {} if counts is None else {"counts": counts},
+        "header": {"name": "circuit", "memory_slots": 2, "creg_sizes": [["c", 2]]},
+    }
+
+
+def _job_result(*counts):
+    return Result.from_dict(
+        {
+            "backend_name": "mock-backend",
+            "backend_version": "0.0.1",
+            "qobj_id": "qobj",
+            "job_id": "job",
+            "success": all(entry is not None for entry in counts),
+            "status": "DONE",
+            "results": [_experiment_result(entry) for entry in counts],
+        }
+    )
+
+
+class TestGettingCountsOfJob:
+    def test_only_circuits_without_results_have_no_histograms(self):
+        job_result = _job_result({"0x0": 4, "0x3": 6}, None, {"0x1": 10})
+
+        assert _get_counts(job_result, 3) == [{"00": 4, "11": 6}, None, {"01": 10}]
+
+    def test_histogram_of_job_with_single_circuit_is_wrapped_in_list(self):
+        assert _get_counts(_job_result({"0x2": 10}), 1) == [{"10": 10}]
+
 
 class TestASynchronousExecutionOfExperiments:
     def test_number_of_fetched_statuses_corresponds_to_number_of_jobs(
@@ -79,6 +143,21 @@ class TestASynchronousExecutionOfExperiments:
 
         assert_sync_results_contain_data_for_all_experiments(experiments, resolved)
 
+    def test_resolving_results_merges_circuits_with_the_same_labels_from_interleaved_batches(
+        self, experiments, async_backend_description
+    ):
+        results = run_experiment(experiments, async_backend_description)
+        # Taking every other batch first makes circuits sharing the same (target, ancilla, phi)
+        # triple land in non-consecutive batches whenever they span more than one batch.
+        results.data = results.data[::2] + results.data[1::2]
+
+        resolved = resolve_results(results)
+
+        assert_sync_results_contain_data_for_all_experiments(experiments, resolved)
+        assert_tabulated_results_contain_data_for_all_experiments(
+            experiments, tabulate_results(resolved)
+        )
+
     def test_tabulating_results_gives_dataframe_with_probabilities_for_all_circuits(
         self, experiments, sync_backend_description
     ):
@@ -98,3 +177,64 @@ class TestASynchronousExecutionOfExperiments:
 
         assert list(tab.columns) == ["target", "ancilla", "phi", "disc_prob", "mit_disc_prob"]
         assert_tabulated_results_contain_data_for_all_experiments(experiments, tab)
+
+    def test_tabulating_results_gives_nan_mitigated_probability_for_entries_without_mitigation(
+        self, experiments, backend_with_mitigation_info_description
+    ):
+        result = run_experiment(experiments, backend_with_mitigation_info_description)
+        # Mitigated quasi-distributions of the noisy mock backend can have vanishing
+        # marginals, so raw histograms are used in their place to keep the test deterministic.
+        for entry in result.data:
+            for circuit_result in entry.results_per_circuit:
+                circuit_result.mitigated_histogram = circuit_result.histogram
+        result.data[-1].results_per_circuit[0].mitigated_histogram = None
+
+        tab = tabulate_results(result)
+
+        assert list(tab.columns) == ["target", "ancilla", "phi", "disc_prob", "mit_disc_prob"]
+        assert tab["mit_disc_prob"].isna().tolist() == [False] * (len(tab) - 1) + [True]
+        assert_tabulated_results_contain_data_for_all_experiments(experiments, tab)
+
+
+class TestMitigation:
+    def test_mitigators_are_reused_when_resolving_results(
+        self, experiments, backend_with_mitigation_info_description
+    ):
+        _get_mitigator.cache_clear()
+
+        run_experiment(experiments, backend_with_mitigation_info_description)
+
+        # Mock backend reports the same readout errors for all qubits, so exactly one
+        # mitigator is created for each of the three pairs of qubits.
+        cache_info = _get_mitigator.cache_info()
+        assert cache_info.misses == 3
+        assert cache_info.hits > 0
+
+    def test_new_mitigator_is_created_if_calibration_data_change(self):
+        backend = MockSimulator()
+
+        mitigator = _get_mitigator(backend, 0, 1, (0.1, 0.2), (0.3, 0.4))
+
+        assert _get_mitigator(backend, 0, 1, (0.1, 0.2), (0.3, 0.4)) is mitigator
+        assert _get_mitigator(backend, 0, 1, (0.1, 0.2), (0.3, 0.5)) is not mitigator
+        assert _get_mitigator(backend, 1, 0, (0.1, 0.2), (0.3, 0.4)) is not mitigator
+
+    def test_histograms_mitigated_together_are_the_same_as_mitigated_one_by_one(self):
+        backend = MockSimulator()
+        mitigation_info = {
+            "target": QubitMitigationInfo(prob_meas0_prep1=0.1, prob_meas1_prep0=0.05),
+            "ancilla": QubitMitigationInfo(prob_meas0_prep1=0.08, prob_meas1_prep0=0.02),
+        }
+        counts = [
+            {"00": 70, "01": 10, "10": 15, "11": 5},
+            {"00": 5, "01": 40, "10": 45, "11": 10},
+            {"00": 25, "01": 25, "10": 25, "11": 25},
+        ]
+
+        batched = _mitigate(counts, 0, 1, backend, mitigation_info)
+        one_by_one = [_mitigate([hist], 0, 1, backend, mitigation_info)[0] for hist in counts]
+
+        assert len(batched) == len(one_by_one) == len(counts)
+        for mitigated, expected in zip(batched, one_by_one):
+            assert mitigated.keys() == expected.keys()
+            assert all(mitigated[key] == pytest.approx(expected[key]) for key in expected)
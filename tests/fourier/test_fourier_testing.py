@@ -0,0 +1,25 @@
+import pytest
+
+from qbench.fourier.testing import _experiment_labels_equal
+
+LABELS = [(0, 1, 0.15), (0, 1, 0.2), (1, 2, 0.3)]
+
+
+def test_labels_differing_only_in_order_and_by_tiny_angle_error_are_equal():
+    assert _experiment_labels_equal(LABELS, [(1, 2, 0.3 + 1e-9), (0, 1, 0.2), (0, 1, 0.15)])
+
+
+def test_angles_on_opposite_sides_of_rounding_boundary_are_equal():
+    assert _experiment_labels_equal([(0, 1, 0.12345675)], [(0, 1, 0.12345675 - 1e-16)])
+
+
+@pytest.mark.parametrize(
+    "other_labels",
+    [
+        [(0, 1, 0.15), (0, 1, 0.2), (1, 3, 0.3)],
+        [(0, 1, 0.15), (0, 1, 0.25), (1, 2, 0.3)],
+        LABELS[:2],
+    ],
+)
+def test_labels_with_different_qubits_angles_or_lengths_are_not_equal(other_labels):
+    assert not _experiment_labels_equal(LABELS, other_labels)
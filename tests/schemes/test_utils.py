@@ -0,0 +1,55 @@
+import pytest
+from qiskit import QuantumCircuit
+from qiskit.result import marginal_counts
+
+from qbench.schemes._utils import marginal_count, run_circuits
+from qbench.testing import MockSimulator
+
+COUNTS = {"00": 10, "01": 7, "10": 3, "11": 25}
+
+
+@pytest.mark.parametrize("bit", [0, 1])
+@pytest.mark.parametrize("outcome", ["0", "1"])
+def test_marginal_count_agrees_with_qiskit_marginal_counts(bit, outcome):
+    assert marginal_count(COUNTS, bit, outcome) == marginal_counts(COUNTS, [bit]).get(outcome, 0)
+
+
+def test_marginal_count_is_zero_if_outcome_was_never_measured():
+    assert marginal_count({"00": 5, "10": 2}, 0, "1") == 0
+
+
+def _circuit_preparing_bitstring(bitstring):
+    circuit = QuantumCircuit(2)
+    for qubit, bit in enumerate(reversed(bitstring)):
+        if bit == "1":
+            circuit.x(qubit)
+    circuit.measure_all()
+    return circuit
+
+
+def test_run_circuits_gives_histograms_of_all_circuits_even_if_they_span_multiple_jobs():
+    # MockSimulator accepts at most two circuits per job, hence two jobs are needed here
+    circuits = {
+        f"prepare_{bitstring}": _circuit_preparing_bitstring(bitstring)
+        for bitstring in ("00", "01", "10", "11")
+    }
+
+    counts = run_circuits(MockSimulator(), circuits, shots=10)
+
+    assert counts == {
+        f"prepare_{bitstring}": {bitstring: 10} for bitstring in ("00", "01", "10", "11")
+    }
+
+
+def test_run_circuits_runs_all_circuits_in_one_job_if_backend_limits_are_unknown(mocker):
+    mocker.patch("qbench.schemes._utils.get_limits", side_effect=NotImplementedError)
+    backend = MockSimulator()
+    run = mocker.spy(backend, "run")
+    # With known limits, MockSimulator would need two jobs for these circuits
+    bitstrings = ("00", "01", "10", "11")
+    circuits = {bitstring: _circuit_preparing_bitstring(bitstring) for bitstring in bitstrings}
+
+    counts = run_circuits(backend, circuits, shots=10)
+
+    assert counts == {bitstring: {bitstring: 10} for bitstring in bitstrings}
+    run.assert_called_once()
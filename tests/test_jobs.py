@@ -0,0 +1,55 @@
+import pytest
+from qiskit.providers.ibmq import IBMQBackend
+
+from qbench.jobs import IBMQ_JOBS_PER_REQUEST, retrieve_jobs
+
+
+def _make_job(mocker, job_id):
+    job = mocker.Mock()
+    job.job_id.return_value = job_id
+    return job
+
+
+@pytest.fixture
+def ibmq_backend(mocker):
+    backend = mocker.Mock(spec=IBMQBackend)
+    known_jobs = {}
+
+    def _jobs(db_filter, limit):
+        ids = db_filter["id"]["inq"]
+        assert len(ids) <= limit <= IBMQ_JOBS_PER_REQUEST
+        # IBMQ makes no guarantees about the order of returned jobs
+        return [known_jobs[job_id] for job_id in reversed(ids) if job_id in known_jobs]
+
+    def _retrieve_job(job_id):
+        return _make_job(mocker, job_id)
+
+    backend.jobs.side_effect = _jobs
+    backend.retrieve_job.side_effect = _retrieve_job
+    backend.known_jobs = known_jobs
+    return backend
+
+
+def test_ibmq_jobs_are_queried_in_chunks_and_returned_in_order_of_requested_ids(
+    mocker, ibmq_backend
+):
+    job_ids = [f"job-{i}" for i in range(2 * IBMQ_JOBS_PER_REQUEST + 50)]
+    ibmq_backend.known_jobs.update({job_id: _make_job(mocker, job_id) for job_id in job_ids})
+
+    jobs = retrieve_jobs(ibmq_backend, job_ids)
+
+    assert [job.job_id() for job in jobs] == job_ids
+    assert ibmq_backend.jobs.call_count == 3
+    ibmq_backend.retrieve_job.assert_not_called()
+
+
+def test_ibmq_jobs_missing_from_bulk_query_are_retrieved_one_by_one(mocker, ibmq_backend):
+    job_ids = ["job-1", "job-2", "job-3"]
+    ibmq_backend.known_jobs.update(
+        {job_id: _make_job(mocker, job_id) for job_id in ("job-1", "job-3")}
+    )
+
+    jobs = retrieve_jobs(ibmq_backend, job_ids)
+
+    assert [job.job_id() for job in jobs] == job_ids
+    ibmq_backend.retrieve_job.assert_called_once_with("job-2")
@@ -2,7 +2,7 @@ from pathlib import Path
 
 import numpy as np
 import pytest
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 from qiskit.providers.aer import AerProvider
 from qiskit_braket_provider import BraketLocalBackend
 from yaml import safe_load
@@ -12,6 +12,8 @@ from qbench.common_models import (
     BackendFactoryDescription,
     IBMQBackendDescription,
     SimpleBackendDescription,
+    SynchronousHistogram,
+    _CachingBackendDescription,
 )
 from qbench.fourier import (
     FourierDiscriminationAsyncResult,
@@ -93,6 +95,86 @@ class TestBackendFactoryDescription:
         assert backend.name() == name
         assert isinstance(backend.provider(), provider_cls)
 
+    @pytest.mark.parametrize(
+        "description",
+        [
+            SimpleBackendDescription(
+                provider="qiskit.providers.aer:AerProvider", name="aer_simulator"
+            ),
+            BackendFactoryDescription(
+                factory="qiskit_braket_provider:BraketLocalBackend", args=["braket_sv"]
+            ),
+        ],
+    )
+    def test_backend_is_created_only_once_when_creating_it_multiple_times(self, description):
+        assert description.create_backend() is description.create_backend()
+
+    def test_backend_is_recreated_if_description_was_copied_with_different_fields(self):
+        description = SimpleBackendDescription(
+            provider="qiskit.providers.aer:AerProvider", name="aer_simulator"
+        )
+        description.create_backend()
+
+        copied = description.copy(update={"name": "aer_simulator_statevector"})
+
+        assert copied.create_backend().name() == "aer_simulator_statevector"
+        assert description.create_backend().name() == "aer_simulator"
+
+    def test_backend_is_recreated_if_fields_of_description_were_modified(self):
+        description = BackendFactoryDescription(
+            factory="qiskit_braket_provider:BraketLocalBackend", args=["braket_sv"]
+        )
+        backend = description.create_backend()
+
+        description.args = ["braket_dm"]
+
+        assert description.create_backend() is not backend
+        assert description.create_backend().backend_name == "braket_dm"
+
+
+class TestIBMQBackendDescription:
+    def test_account_is_enabled_only_once_when_creating_backend_multiple_times(self, mocker):
+        ibmq = mocker.patch("qbench.common_models.IBMQ")
+        ibmq.active_account.return_value = None
+        description = IBMQBackendDescription.parse_obj(
+            {"name": "ibmq-belem", "provider": {"hub": "ibmq-hub", "group": "open"}}
+        )
+
+        backend = description.create_backend()
+
+        assert description.create_backend() is backend
+        ibmq.enable_account.assert_called_once()
+        ibmq.enable_account.return_value.get_backend.assert_called_once_with("ibmq-belem")
+
+    def test_backend_is_recreated_if_description_was_copied_with_different_fields(self, mocker):
+        ibmq = mocker.patch("qbench.common_models.IBMQ")
+        ibmq.active_account.return_value = None
+        description = IBMQBackendDescription.parse_obj(
+            {"name": "ibmq-belem", "provider": {"hub": "ibmq-hub", "group": "open"}}
+        )
+        description.create_backend()
+
+        copied = description.copy(update={"name": "ibmq-quito"})
+        copied.create_backend()
+        description.provider.project = "other-project"
+        description.create_backend()
+
+        get_backend = ibmq.enable_account.return_value.get_backend
+        assert get_backend.call_args_list == [
+            mocker.call("ibmq-belem"),
+            mocker.call("ibmq-quito"),
+            mocker.call("ibmq-belem"),
+        ]
+        assert ibmq.enable_account.call_args.kwargs["project"] == "other-project"
+
+
+def test_backend_description_not_implementing_backend_creation_cannot_be_instantiated():
+    class IncompleteBackendDescription(_CachingBackendDescription):
+        name: str
+
+    with pytest.raises(TypeError):
+        IncompleteBackendDescription(name="mock-backend")
+
 
 class TestFourierDiscriminationExperimentSet:
     @pytest.mark.parametrize(
@@ -229,6 +311,46 @@ class TestAnglesRange:
         with pytest.raises(ValidationError):
             AnglesRange.parse_obj({"start": 2, "stop": 1, "num_steps": 3})
 
+    def test_angles_are_evenly_spaced_between_start_and_stop(self):
+        angles_range = AnglesRange.parse_obj({"start": 0, "stop": 2, "num_steps": 5})
+        assert angles_range.angles == [0.0, 0.5, 1.0, 1.5, 2.0]
+
+    def test_angles_reflect_fields_of_copied_or_modified_range(self):
+        angles_range = AnglesRange.parse_obj({"start": 0, "stop": 2, "num_steps": 3})
+        assert angles_range.angles == [0.0, 1.0, 2.0]
+
+        assert angles_range.copy(update={"num_steps": 5}).angles == [0.0, 0.5, 1.0, 1.5, 2.0]
+
+        angles_range.num_steps = 2
+        assert angles_range.angles == [0.0, 2.0]
+
+
+class TestSynchronousHistogram:
+    class _Model(BaseModel):
+        histogram: SynchronousHistogram
+
+    def test_can_be_parsed_from_correct_input(self):
+        histogram = {"00": 10, "01": 20, "10": 5, "11": 1}
+        assert self._Model(histogram=histogram).histogram == histogram
+
+    @pytest.mark.parametrize(
+        "histogram",
+        [
+            {"0": 10},
+            {"012": 10},
+            {1: 10},
+            {"00": 0},
+            {"00": -1},
+            {"00": 1.0},
+            {"00": "10"},
+            {"00": True},
+            [("00", 10)],
+        ],
+    )
+    def test_fails_to_validate_if_bitstring_or_count_is_invalid(self, histogram):
+        with pytest.raises(ValidationError):
+            self._Model(histogram=histogram)
+
 
 class TestExampleYamlInputsAreMatchingModels:
     def test_fourier_discrimination_experiments_input_matches_model(self):